@@ -1,11 +1,16 @@
-import sys, os, platform, ctypes, json, math
+import sys, os, platform, ctypes, json, math, time, functools, atexit, hashlib, uuid, struct
 from ctypes import wintypes
-from typing import Optional, List, Dict
+from concurrent.futures import ThreadPoolExecutor
+from collections import defaultdict
+from typing import Optional, List, Dict, Tuple, Set
 
-from PySide6.QtCore import Qt, QPoint, QRect, QSize, Signal, QLockFile, QTimer, QEvent
+from PySide6.QtCore import (
+    Qt, QPoint, QRect, QSize, Signal, QLockFile, QTimer, QEvent,
+    QThreadPool, QRunnable, QMutex, QMutexLocker
+)
 from PySide6.QtGui import (
-    QPixmap, QGuiApplication, QPainter, QImageReader, QPixmapCache,
-    QCursor, QColor, QPainterPath, QPolygon, QMovie, QPen, QBrush
+    QPixmap, QImage, QGuiApplication, QPainter, QImageReader, QPixmapCache,
+    QCursor, QColor, QPainterPath, QPolygon, QMovie, QPen, QBrush, QIcon
 )
 from PySide6.QtWidgets import (
     QApplication, QWidget, QToolButton, QMenu,
@@ -18,6 +23,38 @@ try:
 except Exception:
     winreg = None
 
+# 선택 의존성: 있으면 빠른 JSON 직렬화
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS)
+
+    def _loads(raw: bytes):
+        return orjson.loads(raw)
+else:
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), sort_keys=True).encode("utf-8")
+
+    def _loads(raw: bytes):
+        return json.loads(raw.decode("utf-8"))
+
+# 선택 의존성: 있으면 빠른 상태 해시
+try:
+    import xxhash
+except Exception:
+    xxhash = None
+
+if xxhash is not None:
+    def _hash(payload: bytes) -> bytes:
+        return xxhash.xxh3_128_digest(payload)
+else:
+    def _hash(payload: bytes) -> bytes:
+        return hashlib.blake2b(payload, digest_size=16).digest()
+
 if platform.system() == "Windows":
     try:
         ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("MyCompany.StickerBoard.1")
@@ -35,9 +72,13 @@ ROT_BTN_H = 18
 
 ROT_EXTRA_GAP = 12
 MIN_SIDE = 64  # 짧은 변 최소 보장 (비율 유지)
+STICKER_POOL_MAX = 8  # 재사용 대기 StickerWindow 최대 수
 
 IS_EXITING = False
 
+SIDECAR_BUDGET = 128 * 1024 * 1024  # 축소본 PNG 캐시 최대 용량 (bytes)
+_sidecar_dir: Optional[str] = None
+
 
 # ================== Windows: 확실한 TopMost/NotTopMost 적용 유틸 ==================
 def _win_set_topmost(hwnd: int, on: bool):
@@ -60,33 +101,190 @@ def _win_set_topmost(hwnd: int, on: bool):
         pass
 
 
+# ================== 바이너리 상태 포맷 (평소 저장용) ==================
+# 헤더: magic, 포맷 버전, 상태 버전, 스티커 수 / 이후 툴바, 스티커 레코드
+BIN_MAGIC = b"SBRD"
+BIN_VERSION = 2  # 2: 메타 레코드 제거
+_BIN_HEADER = struct.Struct("<4sHHI")
+_BIN_TOOLBAR = struct.Struct("<iiB")
+_BIN_STICKER = struct.Struct("<iiiiiidB")   # x, y, cx, cy, w, h, angle, flags
+_BIN_LEN = struct.Struct("<I")
+
+_FLAG_TOPMOST = 0x01
+_FLAG_LOCKED = 0x02
+_FLAG_CENTER = 0x04  # cx/cy 유효 (구버전 상태에는 없음)
+
+
+def _pack_str(out: List[bytes], text: str) -> None:
+    raw = text.encode("utf-8")
+    out.append(_BIN_LEN.pack(len(raw)))
+    out.append(raw)
+
+
+def _unpack_str(buf: memoryview, off: int) -> Tuple[str, int]:
+    (n,) = _BIN_LEN.unpack_from(buf, off)
+    off += _BIN_LEN.size
+    return bytes(buf[off:off + n]).decode("utf-8"), off + n
+
+
+def _encode_bin(data: Dict) -> bytes:
+    stickers = data.get("stickers", {})
+    tb = data.get("toolbar", {})
+    out = [
+        _BIN_HEADER.pack(BIN_MAGIC, BIN_VERSION, int(data.get("version", 0)), len(stickers)),
+        _BIN_TOOLBAR.pack(int(tb.get("x", 0)), int(tb.get("y", 0)), 1 if tb.get("visible", True) else 0),
+    ]
+    for sid, st in stickers.items():
+        x, y = int(st.get("x", 0)), int(st.get("y", 0))
+        flags = (_FLAG_TOPMOST if st.get("topmost", True) else 0) \
+            | (_FLAG_LOCKED if st.get("locked", False) else 0) \
+            | (_FLAG_CENTER if "cx" in st and "cy" in st else 0)
+        out.append(_BIN_STICKER.pack(
+            x, y, int(st.get("cx", x)), int(st.get("cy", y)),
+            int(st.get("w", 0)), int(st.get("h", 0)),
+            float(st.get("angle", 0.0)), flags,
+        ))
+        _pack_str(out, sid)
+        _pack_str(out, st.get("path", ""))
+    return b"".join(out)
+
+
+def _decode_bin(raw: bytes) -> Dict:
+    buf = memoryview(raw)
+    magic, fmt, version, count = _BIN_HEADER.unpack_from(buf, 0)
+    if magic != BIN_MAGIC or fmt != BIN_VERSION:
+        raise ValueError("unsupported state.bin")
+    off = _BIN_HEADER.size
+    tx, ty, tvis = _BIN_TOOLBAR.unpack_from(buf, off)
+    off += _BIN_TOOLBAR.size
+    stickers: Dict[str, Dict] = {}
+    for _ in range(count):
+        x, y, cx, cy, w, h, angle, flags = _BIN_STICKER.unpack_from(buf, off)
+        off += _BIN_STICKER.size
+        sid, off = _unpack_str(buf, off)
+        path, off = _unpack_str(buf, off)
+        st = {
+            "path": path, "x": x, "y": y, "w": w, "h": h,
+            "topmost": bool(flags & _FLAG_TOPMOST),
+            "locked": bool(flags & _FLAG_LOCKED),
+            "angle": angle,
+        }
+        if flags & _FLAG_CENTER:
+            st["cx"], st["cy"] = cx, cy
+        stickers[sid] = st
+    return {
+        "version": version,
+        "toolbar": {"x": tx, "y": ty, "visible": bool(tvis)},
+        "stickers": stickers,
+    }
+
+
 # ================== 저장 매니저 ==================
 class SaveManager:
-    def __init__(self):
+    def __init__(self, fsync: Optional[bool] = None):
         if platform.system() == "Windows":
             base = r"C:\StickerBoard"
         else:
             base = os.path.join(os.path.expanduser("~"), "StickerBoard")
         os.makedirs(base, exist_ok=True)
         self.base = base
-        self.path = os.path.join(base, "Save.dat")
+        self.path = os.path.join(base, "Save.dat")      # JSON: 종료 시/복원 정리 시
+        self.bin_path = os.path.join(base, "state.bin")  # 바이너리: 평소 자동 저장
+        self.cache_dir = os.path.join(base, "cache")
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._last_hash: Dict[str, bytes] = {}  # 파일 경로별 마지막 기록 해시
+        # 평소 저장은 fsync 생략, 종료 시 flush()에서 1회. STICKERBOARD_FSYNC=1 이면 매번
+        if fsync is None:
+            fsync = os.environ.get("STICKERBOARD_FSYNC", "0") != "0"
+        self.fsync = fsync
+
+        # 비동기 저장: 단일 슬롯 큐 (새 상태가 오면 대기 중인 이전 상태는 폐기)
+        self._write_mutex = QMutex()
+        self._queue_mutex = QMutex()
+        self._queued: Optional[Dict] = None
+        self._job_running = False
+        self._async_closed = False  # 종료 시작 후 state.bin 기록 금지
 
     def load(self) -> Optional[Dict]:
+        # state.bin 이 JSON 보다 새로우면 우선 (비정상 종료 시 마지막 자동 저장)
+        try:
+            bin_mt = os.stat(self.bin_path).st_mtime_ns
+            try:
+                json_mt = os.stat(self.path).st_mtime_ns
+            except OSError:
+                json_mt = -1
+            if bin_mt > json_mt:
+                with open(self.bin_path, "rb") as f:
+                    raw = f.read()
+                data = _decode_bin(raw)
+                self._last_hash[self.bin_path] = _hash(raw)
+                return data
+        except Exception:
+            pass  # 없거나 손상 → JSON 으로
         try:
             if not os.path.exists(self.path):
                 return None
-            with open(self.path, "r", encoding="utf-8") as f:
-                return json.load(f)
+            with open(self.path, "rb") as f:
+                raw = f.read()
+            # 디스크 내용과 같은 상태의 첫 저장은 생략되도록 해시 시드
+            self._last_hash[self.path] = _hash(raw)
+            return _loads(raw)
         except Exception:
             return None
 
-    def save(self, data: Dict) -> None:
-        tmp = self.path + ".tmp"
+    def save_async(self, data: Dict) -> None:
+        with QMutexLocker(self._queue_mutex):
+            if self._async_closed:
+                return
+            self._queued = data
+            if self._job_running:
+                return
+            self._job_running = True
+        QThreadPool.globalInstance().start(_SaveJob(self))
+
+    def close_async(self) -> None:
+        # 대기 중인 스냅샷 폐기 + 이후 바이너리 기록 거부
+        # (waitForDone 시간 초과 후 남은 작업이 최종 JSON 보다 늦게 state.bin 을 쓰지 않도록)
+        with QMutexLocker(self._queue_mutex):
+            self._queued = None
+            self._async_closed = True
+
+    def _take_queued(self) -> Optional[Dict]:
+        with QMutexLocker(self._queue_mutex):
+            data, self._queued = self._queued, None
+            if data is None:
+                self._job_running = False
+            return data
+
+    def save(self, data: Dict, binary: bool = False, force: bool = False) -> None:
+        with QMutexLocker(self._write_mutex):
+            if binary:
+                with QMutexLocker(self._queue_mutex):
+                    if self._async_closed:
+                        return
+                self._save_locked(self.bin_path, data, _encode_bin, force)
+            else:
+                self._save_locked(self.path, data, _dumps, force)
+
+    def _save_locked(self, path: str, data: Dict, encode, force: bool = False) -> None:
+        tmp = path + ".tmp"
         try:
-            with open(tmp, "w", encoding="utf-8") as f:
-                json.dump(data, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
-                f.flush(); os.fsync(f.fileno())
-            os.replace(tmp, self.path)
+            # 인코딩 실패(예: 서로게이트 포함 경로)도 저장 실패로만 처리
+            payload = encode(data)
+            h = _hash(payload)
+            if not force and h == self._last_hash.get(path):
+                return  # 변경 없음 → 디스크 I/O 생략
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0), 0o644)
+            try:
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                if self.fsync:
+                    os.fsync(fd)
+            finally:
+                os.close(fd)
+            os.replace(tmp, path)
+            self._last_hash[path] = h
         except Exception:
             try:
                 if os.path.exists(tmp):
@@ -95,6 +293,39 @@ class SaveManager:
                 pass
 
 
+    def flush(self, fsync: bool = True) -> None:
+        # 종료 시 내구성 확보용
+        if not fsync:
+            return
+        with QMutexLocker(self._write_mutex):
+            try:
+                fd = os.open(self.path, os.O_RDWR | getattr(os, "O_BINARY", 0))
+            except OSError:
+                return
+            try:
+                os.fsync(fd)
+            except OSError:
+                pass
+            finally:
+                os.close(fd)
+
+
+class _SaveJob(QRunnable):
+    def __init__(self, manager: SaveManager):
+        super().__init__()
+        self.manager = manager
+
+    def run(self):
+        while True:
+            data = self.manager._take_queued()
+            if data is None:
+                return  # _take_queued()가 _job_running 해제
+            try:
+                self.manager.save(data, binary=True)
+            except Exception:
+                pass  # 작업이 중간에 빠지면 이후 save_async 가 영구 대기
+
+
 def WT(name):
     return getattr(Qt.WindowType, name) if hasattr(Qt, "WindowType") else Qt.__dict__[name]
 
@@ -125,50 +356,222 @@ def _cache_find(key: str) -> Optional[QPixmap]:
 def _cache_insert(key: str, pm: QPixmap) -> None:
     QPixmapCache.insert(key, pm)
 
+# path -> (mtime, 만료시각): 조회마다 stat 하지 않도록 짧은 TTL 캐시
+_mtime_cache: Dict[str, Tuple[float, float]] = {}
+_MTIME_TTL = 2.0
+
 def _cache_key(path: str) -> str:
-    try:
-        mt = os.path.getmtime(path)
-    except OSError:
-        mt = 0
+    now = time.monotonic()
+    hit = _mtime_cache.get(path)
+    if hit is not None and now < hit[1]:
+        mt = hit[0]
+    else:
+        try:
+            mt = os.path.getmtime(path)
+        except OSError:
+            mt = 0
+        _mtime_cache[path] = (mt, now + _MTIME_TTL)
     return f"{path}|{mt}"
 
-def load_pixmap_fixed(path: str, target: QSize, device_ratio: float) -> QPixmap:
-    key = _cache_key(path) + f"|{target.width()}x{target.height()}@{device_ratio:.2f}"
-    pm = _cache_find(key)
-    if pm:
-        return pm
+def _forget_mtime(path: str) -> None:
+    _mtime_cache.pop(path, None)
+
+# path -> (mtime_ns, size, w, h): 원본 크기 캐시 (세션 내 재추가 시 헤더 재조회 생략)
+_image_meta: Dict[str, Tuple[int, int, int, int]] = {}
 
-    reader = QImageReader(path)
+def image_natural_size(path: str, reader: Optional[QImageReader] = None) -> QSize:
+    try:
+        st = os.stat(path)
+        stamp = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        stamp = None
+    meta = _image_meta.get(path)
+    if meta is not None and stamp is not None and meta[:2] == stamp:
+        return QSize(meta[2], meta[3])
+
+    if reader is None:
+        reader = QImageReader(path)
+        reader.setAutoTransform(False)
+    sz = reader.size()
+    if stamp is not None and sz.isValid():
+        _image_meta[path] = (stamp[0], stamp[1], sz.width(), sz.height())
+    return QSize(sz)
+
+def _pixmap_key(path: str, target: QSize, device_ratio: float) -> str:
+    return _cache_key(path) + f"|{target.width()}x{target.height()}@{device_ratio:.2f}"
+
+def _read_scaled_image(path: str, target: QSize, device_ratio: float,
+                       reader: Optional[QImageReader] = None) -> QImage:
+    # QImage 디코드만 수행 → 워커 스레드에서 호출 가능
+    if reader is None:
+        reader = QImageReader(path)
+    # 크기 probe가 실패해도 스케일 힌트는 항상 전달 (JPEG 플러그인은 IDCT 단계에서 축소)
+    reader.setScaledSize(QSize(
+        max(1, int(target.width() * device_ratio)),
+        max(1, int(target.height() * device_ratio))
+    ))
+    if bytes(reader.format()).lower() in (b"jpeg", b"jpg"):
+        reader.setQuality(25)  # 빠른 IDCT 경로
     reader.setAutoTransform(False)
-    if reader.size().isValid():
-        reader.setScaledSize(QSize(
-            max(1, int(target.width() * device_ratio)),
-            max(1, int(target.height() * device_ratio))
-        ))
-    img = reader.read()
+    return reader.read()
+
+def _pixmap_from_image(img: QImage, target: QSize, device_ratio: float) -> QPixmap:
+    # QPixmap 변환은 GUI 스레드 전용
     if img.isNull():
         pm = QPixmap(target); pm.fill(Qt.transparent)
     else:
         pm = QPixmap.fromImage(img)
         pm.setDevicePixelRatio(device_ratio)
+    return pm
+
+def load_pixmap_fixed(path: str, target: QSize, device_ratio: float,
+                      reader: Optional[QImageReader] = None) -> QPixmap:
+    key = _pixmap_key(path, target, device_ratio)
+    pm = _cache_find(key)
+    if pm:
+        return pm
 
+    pm = _pixmap_from_image(_read_scaled_image(path, target, device_ratio, reader), target, device_ratio)
     _cache_insert(key, pm)
     return pm
 
+@functools.lru_cache(maxsize=32)
+def _std_icon(sp_enum) -> QIcon:
+    # QStyle 조회는 종류별 1회 (트레이 재생성 등에서 재사용)
+    return QApplication.instance().style().standardIcon(sp_enum)
+
+
+# ================== 축소본 디스크 캐시 (sidecar) ==================
+def configure_sidecar_cache(cache_dir: str, budget: int = SIDECAR_BUDGET) -> None:
+    global _sidecar_dir
+    _sidecar_dir = cache_dir
+    # 오래 안 쓴(atime) 파일부터 삭제해 budget 이하로 유지
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [(e.stat().st_atime, e.stat().st_size, e.path) for e in it
+                       if e.is_file() and e.name.endswith(".png")]
+    except OSError:
+        return
+    total = sum(sz for _, sz, _ in entries)
+    for _, sz, path in sorted(entries):
+        if total <= budget:
+            break
+        try:
+            os.remove(path)
+            total -= sz
+        except OSError:
+            pass
+
+def _sidecar_path(path: str, target: QSize, device_ratio: float) -> Optional[str]:
+    if _sidecar_dir is None:
+        return None
+    try:
+        mt = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    # fsencode: 비 UTF-8 파일명(서로게이트 이스케이프)도 원래 바이트로 해시
+    key = os.fsencode(path) + f"|{mt}|{target.width()}x{target.height()}@{device_ratio:.2f}".encode("ascii")
+    return os.path.join(_sidecar_dir, hashlib.sha1(key).hexdigest() + ".png")
+
+def _write_sidecar(img: QImage, sidecar: str) -> None:
+    tmp = sidecar + ".tmp"
+    try:
+        if img.save(tmp, "PNG"):
+            os.replace(tmp, sidecar)
+    except OSError:
+        pass
+    finally:
+        try:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+        except OSError:
+            pass
+
+def _read_scaled_image_cached(path: str, target: QSize, device_ratio: float) -> QImage:
+    # 워커 스레드용: 축소본이 있으면 원본 디코드 생략, 없으면 디코드 후 축소본 기록
+    sidecar = _sidecar_path(path, target, device_ratio)
+    if sidecar is not None and os.path.exists(sidecar):
+        img = QImage(sidecar)
+        if not img.isNull():
+            return img
+    img = _read_scaled_image(path, target, device_ratio)
+    if sidecar is not None and not img.isNull():
+        _write_sidecar(img, sidecar)
+    return img
+
+class _SidecarJob(QRunnable):
+    def __init__(self, img: QImage, sidecar: str):
+        super().__init__()
+        self.img = img
+        self.sidecar = sidecar
+
+    def run(self):
+        _write_sidecar(self.img, self.sidecar)
+
+def store_sidecar_async(path: str, target: QSize, device_ratio: float, pm: QPixmap) -> None:
+    # 축소본은 최적화일 뿐: 실패해도 호출 측(리사이즈 마무리)을 끊지 않음
+    try:
+        sidecar = _sidecar_path(path, target, device_ratio)
+        if sidecar is None or pm.isNull() or os.path.exists(sidecar):
+            return
+        QThreadPool.globalInstance().start(_SidecarJob(pm.toImage(), sidecar))
+    except Exception:
+        pass
+
+
+# ================== 파일 존재 확인 ==================
+def _scan_dir(d: str, paths: List[str]) -> Set[str]:
+    # 같은 폴더의 여러 파일: stat N번 대신 readdir 1번 (DirEntry 캐시 메타데이터 사용)
+    if len(paths) > 1:
+        try:
+            with os.scandir(d or ".") as it:
+                names = {os.path.normcase(e.name) for e in it if e.is_file()}
+            return {p for p in paths if os.path.normcase(os.path.basename(p)) in names}
+        except OSError:
+            pass  # 목록 권한 없음 등 → 파일별 확인
+    # 원래 경로 그대로 stat (normcase 된 이름은 대소문자 구분 폴더에서 틀림)
+    return {p for p in paths if os.path.isfile(p)}
+
+def existing_paths(paths: List[str], executor: ThreadPoolExecutor) -> Set[str]:
+    by_dir: Dict[str, List[str]] = defaultdict(list)
+    for p in paths:
+        by_dir[os.path.dirname(p)].append(p)
+    found: Set[str] = set()
+    for hits in executor.map(lambda d: _scan_dir(d, by_dir[d]), list(by_dir)):
+        found |= hits
+    return found
+
 
 # ================== 시작프로그램 유틸 ==================
+# access mode -> 열린 Run 키 핸들 (매 호출 Open/Close 방지)
+_run_key_cache: Dict[int, object] = {}
+
+def _run_key(access: int):
+    key = _run_key_cache.get(access)
+    if key is None:
+        key = winreg.OpenKey(winreg.HKEY_CURRENT_USER,
+                             r"Software\Microsoft\Windows\CurrentVersion\Run",
+                             0, access)
+        _run_key_cache[access] = key
+    return key
+
+@atexit.register
+def _close_run_keys():
+    for key in _run_key_cache.values():
+        try:
+            key.Close()
+        except Exception:
+            pass
+    _run_key_cache.clear()
+
 def _win_is_startup_enabled(name: str) -> bool:
     if platform.system() != "Windows" or winreg is None:
         return False
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                            r"Software\Microsoft\Windows\CurrentVersion\Run",
-                            0, winreg.KEY_READ) as key:
-            try:
-                _ = winreg.QueryValueEx(key, name)
-                return True
-            except FileNotFoundError:
-                return False
+        _ = winreg.QueryValueEx(_run_key(winreg.KEY_READ), name)
+        return True
+    except FileNotFoundError:
+        return False
     except OSError:
         return False
 
@@ -191,16 +594,14 @@ def _win_set_startup(name: str, enable: bool) -> bool:
     if platform.system() != "Windows" or winreg is None:
         return False
     try:
-        with winreg.OpenKey(winreg.HKEY_CURRENT_USER,
-                            r"Software\Microsoft\Windows\CurrentVersion\Run",
-                            0, winreg.KEY_SET_VALUE | winreg.KEY_READ) as key:
-            if enable:
-                winreg.SetValueEx(key, name, 0, winreg.REG_SZ, _win_get_startup_command())
-            else:
-                try:
-                    winreg.DeleteValue(key, name)
-                except FileNotFoundError:
-                    pass
+        key = _run_key(winreg.KEY_SET_VALUE | winreg.KEY_READ)
+        if enable:
+            winreg.SetValueEx(key, name, 0, winreg.REG_SZ, _win_get_startup_command())
+        else:
+            try:
+                winreg.DeleteValue(key, name)
+            except FileNotFoundError:
+                pass
         return True
     except OSError:
         return False
@@ -208,7 +609,8 @@ def _win_set_startup(name: str, enable: bool) -> bool:
 
 # ================== StickerWindow ==================
 class StickerWindow(QWidget):
-    stateChanged = Signal()
+    stateChanged = Signal(str)  # sticker_id
+    closed = Signal(object)     # self (풀 반납용)
 
     __slots__ = (
         "dragging", "resizing", "rotating",
@@ -218,7 +620,7 @@ class StickerWindow(QWidget):
         "btn_close", "btn_rotate", "locked", "rotation_angle",
         "base_w", "base_h", "pm_base", "movie",
         "_resizing_pending_size",
-        "_resize_tri", "_resize_tri_pts",
+        "_resize_tri", "_hit_coefs", "_mask_poly", "_img_aabb",
         "_start_base_w", "_start_base_h",
         "_mask_pending",
         "_saved_center", "_pos_fix_applied",
@@ -226,10 +628,17 @@ class StickerWindow(QWidget):
         "_scale_ema",
         "_last_applied_geom",
         "_show_resize_handle",
-        "_act_lock", "_act_top", "_act_bot", "_act_reset", "_act_close"
+        "_cached_angle", "_cached_ca", "_cached_sa",
+        "_pending_move_gpos", "_move_timer",
+        "_pending_pos", "_move_scheduled",
+        "_last_hover_pos", "_last_hover_inside",
+        "_overlay_btn_pos",
+        "_act_lock", "_act_top", "_act_bot", "_act_reset", "_act_close",
+        "sticker_id",
     )
 
-    def __init__(self, image_path: str, start_pos: Optional[QPoint] = None, *, initial_topmost: bool = True):
+    def __init__(self, image_path: str, start_pos: Optional[QPoint] = None, *, initial_topmost: bool = True,
+                 sticker_id: Optional[str] = None, base_size: Optional[QSize] = None):
         super().__init__(parent=None)
         self.setAttribute(Qt.WA_DeleteOnClose, True)
         self.setAttribute(Qt.WA_TranslucentBackground, True)
@@ -239,80 +648,18 @@ class StickerWindow(QWidget):
         self.setContentsMargins(0, 0, 0, 0)
         self.setWindowFlags(wf(WT("FramelessWindowHint"), WT("Tool"), WT("NoDropShadowWindowHint")))
 
-        self.image_path = image_path
-        self.setWindowTitle(os.path.basename(image_path))
-
-        # 상태
-        self.dragging = False
-        self.resizing = False
-        not_used = False
-        self.rotating = False
         self.resize_margin = 18
         self.rotate_scale = 0.5
-        self.locked = False
-        self.rotation_angle = 0.0
-        self._mask_pending = False
-
         self.pm_base: QPixmap = QPixmap()
         self.movie: Optional[QMovie] = None
 
-        self._resizing_pending_size = None
-        self._resize_tri = None
-        self._resize_tri_pts = None
-        self._start_base_w = None
-        self._start_base_h = None
-
-        self._saved_center: Optional[QPoint] = None
-        self._pos_fix_applied = False
-        self._resize_anchor_pt: Optional[QPoint] = None
-        self._scale_ema: float = 1.0
-        self._last_applied_geom: Optional[QRect] = None
-        self._show_resize_handle = False
-
-        # 화면 스케일
-        screen = self.screen() or QGuiApplication.primaryScreen()
-        self.device_ratio = (screen.devicePixelRatio() if screen else 1.0) or 1.0
-
-        # 초기 크기(비율 유지 + 짧은 변 최소 보장)
-        reader = QImageReader(image_path)
-        reader.setAutoTransform(False)
-        natural = reader.size() if reader.size().isValid() else QSize(300, 300)
-        self.aspect_ratio = (natural.width() / natural.height()) if natural.height() > 0 else 1.0
-
-        scr = self.screen() or QGuiApplication.primaryScreen()
-        scr_size = scr.availableGeometry().size() if scr else QSize(1920, 1080)
-        max_w = int(min(scr_size.width() * 0.35, 720))
-        max_h = int(min(scr_size.height() * 0.35, 720))
-        fit_scale = min(max_w / max(1, natural.width()), max_h / max(1, natural.height()), 1.0)
-        base_scale = 1.0 if natural.width() <= 320 or natural.height() <= 320 else 0.6
-        s = min(fit_scale, base_scale)
-
-        w0 = max(1, int(natural.width() * s))
-        h0 = max(1, int(natural.height() * s))
-        short = min(w0, h0)
-        if short < MIN_SIDE:
-            scale_fix = MIN_SIDE / float(short)
-            w0 = int(round(w0 * scale_fix))
-            h0 = int(round(h0 * scale_fix))
-        self.base_w = w0
-        self.base_h = h0
-
-        # 정지/애니메이션 분기
-        if image_path.lower().endswith(".gif"):
-            mv = QMovie(image_path)
-            if mv.isValid():
-                mv.setCacheMode(QMovie.CacheNone)  # 메모리 최소화
-                mv.setScaledSize(QSize(self.base_w, self.base_h))
-                mv.frameChanged.connect(self.update)
-                mv.start()
-                self.movie = mv
-            else:
-                self.pm_base = load_pixmap_fixed(self.image_path, QSize(self.base_w, self.base_h), self.device_ratio)
-        else:
-            self.pm_base = load_pixmap_fixed(self.image_path, QSize(self.base_w, self.base_h), self.device_ratio)
+        # 회전/리사이즈 mouseMove 병합 (~120Hz)
+        self._move_timer = QTimer(self)
+        self._move_timer.setSingleShot(True)
+        self._move_timer.setInterval(8)
+        self._move_timer.timeout.connect(self._process_pending_move)
 
-        side = self._max_square_side(self.base_w, self.base_h)
-        self.resize(side, side)
+        self.reset()
 
         # 버튼
         self.btn_close = QToolButton(self)
@@ -356,6 +703,116 @@ class StickerWindow(QWidget):
         self._act_close = self.menu.addAction("닫기")
         self.menu.triggered.connect(self._on_menu)
 
+        self.rebind(image_path, start_pos, initial_topmost=initial_topmost, sticker_id=sticker_id,
+                    base_size=base_size)
+
+    # ======= 상태 초기화 / 재바인딩 (풀 재사용) =======
+    def reset(self):
+        # 상태
+        self.dragging = False
+        self.resizing = False
+        self.rotating = False
+        self.locked = False
+        self.rotation_angle = 0.0
+        self._mask_pending = False
+
+        if self.movie is not None:
+            try:
+                self.movie.stop()
+                self.movie.deleteLater()
+            except Exception:
+                pass
+            self.movie = None
+        self.pm_base = QPixmap()
+
+        self._resizing_pending_size = None
+        self._resize_tri = None
+        self._hit_coefs = None
+        self._mask_poly: Optional[QPolygon] = None
+        self._img_aabb: Optional[QRect] = None
+        self._start_base_w = None
+        self._start_base_h = None
+
+        self._saved_center: Optional[QPoint] = None
+        self._pos_fix_applied = False
+        self._resize_anchor_pt: Optional[QPoint] = None
+        self._scale_ema: float = 1.0
+        self._last_applied_geom: Optional[QRect] = None
+        self._show_resize_handle = False
+        self._last_hover_pos: Optional[QPoint] = None
+        self._last_hover_inside: Optional[bool] = None
+        self._overlay_btn_pos = None
+        self._cached_angle: Optional[float] = None
+        self._cached_ca: float = 1.0
+        self._cached_sa: float = 0.0
+
+        self._pending_move_gpos: Optional[QPoint] = None
+        self._move_timer.stop()
+        self._pending_pos: Optional[QPoint] = None
+        self._move_scheduled = False
+
+    def rebind(self, image_path: str, start_pos: Optional[QPoint] = None, *, initial_topmost: bool = True,
+               sticker_id: Optional[str] = None, base_size: Optional[QSize] = None):
+        self.image_path = image_path
+        self.sticker_id = sticker_id or uuid.uuid4().hex
+        self.setWindowTitle(os.path.basename(image_path))
+
+        # 화면 스케일
+        screen = self.screen() or QGuiApplication.primaryScreen()
+        self.device_ratio = (screen.devicePixelRatio() if screen else 1.0) or 1.0
+
+        reader: Optional[QImageReader] = None
+        if base_size is not None and base_size.isValid():
+            # 복원: 저장된 크기로 바로 로드 (선적재 캐시/사이드카와 같은 키, 기본 크기 디코드 생략)
+            self.base_w = max(32, base_size.width())
+            self.base_h = max(32, base_size.height())
+            self.aspect_ratio = self.base_w / self.base_h
+        else:
+            # 초기 크기(비율 유지 + 짧은 변 최소 보장)
+            reader = QImageReader(image_path)
+            reader.setAutoTransform(False)
+            natural = image_natural_size(image_path, reader)
+            if not natural.isValid():
+                natural = QSize(300, 300)
+            self.aspect_ratio = (natural.width() / natural.height()) if natural.height() > 0 else 1.0
+
+            scr = self.screen() or QGuiApplication.primaryScreen()
+            scr_size = scr.availableGeometry().size() if scr else QSize(1920, 1080)
+            max_w = int(min(scr_size.width() * 0.35, 720))
+            max_h = int(min(scr_size.height() * 0.35, 720))
+            fit_scale = min(max_w / max(1, natural.width()), max_h / max(1, natural.height()), 1.0)
+            base_scale = 1.0 if natural.width() <= 320 or natural.height() <= 320 else 0.6
+            s = min(fit_scale, base_scale)
+
+            w0 = max(1, int(natural.width() * s))
+            h0 = max(1, int(natural.height() * s))
+            short = min(w0, h0)
+            if short < MIN_SIDE:
+                scale_fix = MIN_SIDE / float(short)
+                w0 = int(round(w0 * scale_fix))
+                h0 = int(round(h0 * scale_fix))
+            self.base_w = w0
+            self.base_h = h0
+
+        # 정지/애니메이션 분기
+        if image_path.lower().endswith(".gif"):
+            mv = QMovie(image_path)
+            if mv.isValid():
+                mv.setCacheMode(QMovie.CacheNone)  # 메모리 최소화
+                mv.setScaledSize(QSize(self.base_w, self.base_h))
+                mv.frameChanged.connect(self.update)
+                mv.start()
+                self.movie = mv
+            else:
+                self.pm_base = load_pixmap_fixed(self.image_path, QSize(self.base_w, self.base_h), self.device_ratio,
+                                                 reader=reader)
+        else:
+            self.pm_base = load_pixmap_fixed(self.image_path, QSize(self.base_w, self.base_h), self.device_ratio,
+                                             reader=reader)
+
+        side = self._max_square_side(self.base_w, self.base_h)
+        self.resize(side, side)
+
         if start_pos:
             self.move(start_pos)
         if initial_topmost:
@@ -369,6 +826,8 @@ class StickerWindow(QWidget):
 
     # ======= 수명 / 자원 정리 =======
     def closeEvent(self, e):
+        _forget_mtime(self.image_path)
+        self.closed.emit(self)
         try:
             if self.movie is not None:
                 self.movie.stop()
@@ -380,12 +839,24 @@ class StickerWindow(QWidget):
 
     # ======= 수학 유틸 =======
     @staticmethod
+    @functools.lru_cache(maxsize=256)
     def _max_square_side(w: int, h: int) -> int:
-        return int(math.ceil(math.sqrt(w*w + h*h))) + 2
+        # ceil(sqrt(w^2 + h^2)) 정수 연산
+        s2 = w*w + h*h
+        s = math.isqrt(s2)
+        return (s if s*s == s2 else s + 1) + 2
+
+    def _trig(self):
+        # 각도가 바뀔 때만 cos/sin 재계산
+        angle = self.rotation_angle or 0.0
+        if self._cached_angle != angle:
+            a = math.radians(angle)
+            self._cached_ca, self._cached_sa = math.cos(a), math.sin(a)
+            self._cached_angle = angle
+        return self._cached_ca, self._cached_sa
 
     def _map_image_center_to_widget(self, vx: float, vy: float) -> QPoint:
-        a = math.radians(self.rotation_angle or 0.0)
-        ca, sa = math.cos(a), math.sin(a)
+        ca, sa = self._trig()
         rx = vx * ca - vy * sa
         ry = vx * sa + vy * ca
         cx, cy = self.rect().center().x(), self.rect().center().y()
@@ -395,11 +866,15 @@ class StickerWindow(QWidget):
         w, h = self._current_image_w_h()
         if w <= 0 or h <= 0:
             return False
+        # 리사이즈 중에는 AABB가 pending 크기보다 늦을 수 있으므로 정밀 판정만
+        if (self._img_aabb is not None and not self.resizing
+                and not self._img_aabb.contains(pos)):
+            return False
         wc = self.rect().center()
         vxw = pos.x() - wc.x()
         vyw = pos.y() - wc.y()
-        a = -math.radians(self.rotation_angle or 0.0)
-        ca, sa = math.cos(a), math.sin(a)
+        ca, sa = self._trig()
+        sa = -sa  # 역회전: cos(-a) = cos(a), sin(-a) = -sin(a)
         vxi = vxw * ca - vyw * sa
         vyi = vxw * sa + vyw * ca
         return (abs(vxi) <= (w * 0.5) + 0.5) and (abs(vyi) <= (h * 0.5) + 0.5)
@@ -411,9 +886,17 @@ class StickerWindow(QWidget):
                 pos = self.mapFromGlobal(gp)
             except Exception:
                 pos = self.rect().center()
+        # 3px 미만 이동 + 캐시된 판정이 있으면 생략
+        last = self._last_hover_pos
+        if (self._last_hover_inside is not None and last is not None
+                and abs(pos.x() - last.x()) + abs(pos.y() - last.y()) < 3):
+            return
         inside = self._is_pos_in_image(pos)
-        self.btn_close.setVisible(inside)
-        self.btn_rotate.setVisible(inside)
+        self._last_hover_pos = QPoint(pos)
+        if inside != self._last_hover_inside:
+            self._last_hover_inside = inside
+            self.btn_close.setVisible(inside)
+            self.btn_rotate.setVisible(inside)
         if getattr(self, "_show_resize_handle", False) != inside:
             self._show_resize_handle = inside
             self.update()
@@ -423,47 +906,70 @@ class StickerWindow(QWidget):
         return self._resizing_pending_size if self._resizing_pending_size else (self.base_w, self.base_h)
 
     def _place_overlay_controls(self):
+        self._last_hover_inside = None  # 형상 변경 → hover 판정 무효화
         w, h = self._current_image_w_h()
         pad = max(BTN_MARGIN, 2)
+        # 앵커 5개 + 마스크 꼭짓점 공통: trig/center 1회만 계산
+        ca, sa = self._trig()
+        rc = self.rect().center()
+        cx, cy = rc.x(), rc.y()
+
+        def M(vx: float, vy: float) -> QPoint:
+            return QPoint(int(round(cx + vx * ca - vy * sa)), int(round(cy + vx * sa + vy * ca)))
+
         # close
         close_anchor_img = (w/2 - pad - (CLOSE_BTN_W/2),
                             -h/2 + pad + (CLOSE_BTN_H/2))
-        p_close = self._map_image_center_to_widget(*close_anchor_img)
-        self.btn_close.move(int(p_close.x() - CLOSE_BTN_W//2),
-                            int(p_close.y() - CLOSE_BTN_H//2))
+        p_close = M(*close_anchor_img)
+        close_xy = (int(p_close.x() - CLOSE_BTN_W//2), int(p_close.y() - CLOSE_BTN_H//2))
         # rotate
         rotate_gap = ROT_EXTRA_GAP + (CLOSE_BTN_W + ROT_BTN_W) / 2.0
         rotate_anchor_img = (w/2 - pad - rotate_gap,
                              -h/2 + pad + (ROT_BTN_H/2))
-        p_rot = self._map_image_center_to_widget(*rotate_anchor_img)
-        self.btn_rotate.move(int(p_rot.x() - ROT_BTN_W//2),
-                             int(p_rot.y() - ROT_BTN_H//2))
+        p_rot = M(*rotate_anchor_img)
+        rot_xy = (int(p_rot.x() - ROT_BTN_W//2), int(p_rot.y() - ROT_BTN_H//2))
+
+        # 1px 이상 바뀐 버튼만 move (회전 드래그 중 불필요한 move 방지)
+        last = self._overlay_btn_pos
+        if last is None or last[0] != close_xy:
+            self.btn_close.move(*close_xy)
+        if last is None or last[1] != rot_xy:
+            self.btn_rotate.move(*rot_xy)
+        self._overlay_btn_pos = (close_xy, rot_xy)
 
         # 리사이즈 핸들 삼각형
         s = self.resize_margin
-        p1 = self._map_image_center_to_widget(w/2,     h/2)
-        p2 = self._map_image_center_to_widget(w/2 - s, h/2)
-        p3 = self._map_image_center_to_widget(w/2,     h/2 - s)
+        p1 = M(w/2,     h/2)
+        p2 = M(w/2 - s, h/2)
+        p3 = M(w/2,     h/2 - s)
         path = QPainterPath(); path.moveTo(p1); path.lineTo(p2); path.lineTo(p3); path.closeSubpath()
         self._resize_tri = path
-        self._resize_tri_pts = (p1, p2, p3)
+
+        # 마스크 꼭짓점 (우하단 = p1 재사용)
+        hw, hh = w/2, h/2
+        self._mask_poly = QPolygon([M(-hw, -hh), M(hw, -hh), p1, M(-hw, hh)])
+        # hover 판정 fast-reject 용 AABB (반올림 여유 1px)
+        self._img_aabb = self._mask_poly.boundingRect().adjusted(-1, -1, 1, 1)
+
+        # 히트테스트용 barycentric 계수 미리 계산
+        x1, y1 = p1.x(), p1.y()
+        x2, y2 = p2.x(), p2.y()
+        x3, y3 = p3.x(), p3.y()
+        denom = (y2 - y3)*(x1 - x3) + (x3 - x2)*(y1 - y3)
+        if denom == 0:
+            self._hit_coefs = None
+        else:
+            inv = 1.0 / denom
+            self._hit_coefs = (x3, y3,
+                               (y2 - y3) * inv, (x3 - x2) * inv,
+                               (y3 - y1) * inv, (x1 - x3) * inv)
 
     # ======= 마스크 =======
     def _apply_rotated_rect_mask(self):
-        w, h = self._current_image_w_h()
-        hw, hh = w * 0.5, h * 0.5
-        corners = [QPoint(-hw, -hh), QPoint(hw, -hh), QPoint(hw, hh), QPoint(-hw, hh)]
-        a = math.radians(self.rotation_angle or 0.0)
-        ca, sa = math.cos(a), math.sin(a)
-        cx, cy = self.rect().center().x(), self.rect().center().y()
-
-        poly = []
-        for pt in corners:
-            x = pt.x()*ca - pt.y()*sa + cx
-            y = pt.x()*sa + pt.y()*ca + cy
-            poly.append(QPoint(int(round(x)), int(round(y))))
-        region = QPolygon(poly)
-        self.setMask(region)
+        # 꼭짓점은 _place_overlay_controls 에서 함께 계산됨
+        if self._mask_poly is None:
+            self._place_overlay_controls()
+        self.setMask(self._mask_poly)
 
     def _apply_rotated_rect_mask_throttled(self):
         if self._mask_pending:
@@ -478,7 +984,8 @@ class StickerWindow(QWidget):
     # ======= 이벤트 =======
     def resizeEvent(self, e):
         self._place_overlay_controls()
-        self._apply_rotated_rect_mask_throttled()
+        if not (self.resizing or self.rotating):
+            self._apply_rotated_rect_mask_throttled()
         return super().resizeEvent(e)
 
     def showEvent(self, e):
@@ -506,6 +1013,38 @@ class StickerWindow(QWidget):
         except Exception:
             pass
 
+    def _rotated_pixmap(self, draw_w: int, draw_h: int) -> Optional[QPixmap]:
+        # 회전+스케일을 한 번만 적용한 위젯 크기 pixmap (QPixmapCache 보관)
+        pm = self.pm_base
+        if pm.isNull():
+            return None
+        angle = self.rotation_angle or 0.0
+        dpr = self.device_ratio
+        key = _cache_key(self.image_path) + f"|rot{angle:.2f}|{draw_w}x{draw_h}@{dpr:.2f}"
+        cached = _cache_find(key)
+        if cached:
+            return cached
+
+        side = self._max_square_side(draw_w, draw_h)
+        px = max(1, int(math.ceil(side * dpr)))
+        out = QPixmap(px, px)
+        out.setDevicePixelRatio(dpr)
+        out.fill(Qt.transparent)
+
+        base_w, base_h = self.base_w, self.base_h
+        scaling = (draw_w != base_w) or (draw_h != base_h)
+        q = QPainter(out)
+        q.setRenderHint(QPainter.SmoothPixmapTransform, bool(angle or scaling))
+        c = (side - 1) // 2  # QRect.center()와 동일한 기준점
+        q.translate(c, c)
+        if angle:
+            q.rotate(angle)
+        q.drawPixmap(QRect(-draw_w // 2, -draw_h // 2, draw_w, draw_h), pm)
+        q.end()
+
+        _cache_insert(key, out)
+        return out
+
     def paintEvent(self, e):
         p = QPainter(self)
         r = self.rect()
@@ -515,8 +1054,9 @@ class StickerWindow(QWidget):
 
         # ===== 회전시에도 부드럽게 보이도록 항상 스무딩 켜기 =====
         # (스케일 여부와 무관하게 회전 각도가 0이 아니면 강제 활성화)
+        # 단, 리사이즈 드래그 중에는 빠른 non-smooth blit
         def _set_smooth(scaling: bool):
-            if self.rotation_angle or scaling:
+            if (self.rotation_angle or scaling) and not self.resizing:
                 p.setRenderHint(QPainter.SmoothPixmapTransform, True)
             else:
                 p.setRenderHint(QPainter.SmoothPixmapTransform, False)
@@ -527,30 +1067,32 @@ class StickerWindow(QWidget):
                 base_w, base_h = frame.width(), frame.height()
                 scaling = (draw_w != base_w) or (draw_h != base_h)
                 _set_smooth(scaling)
-                p.save()
+                t = p.worldTransform()
                 cx, cy = r.center().x(), r.center().y()
                 p.translate(cx, cy)
                 if self.rotation_angle:
                     p.rotate(self.rotation_angle)
-                if scaling:
-                    p.scale(draw_w / max(1, base_w), draw_h / max(1, base_h))
-                p.drawPixmap(QRect(-base_w // 2, -base_h // 2, base_w, base_h), frame)
-                p.restore()
+                p.drawPixmap(QRect(-draw_w // 2, -draw_h // 2, draw_w, draw_h), frame)
+                p.setWorldTransform(t)
         else:
             pm = self.pm_base
-            if not pm.isNull():
+            # 회전/리사이즈 드래그 중에는 캐시 churn을 피하고 직접 그림, 0도는 그대로 blit
+            rotated = None if (self.rotating or self.resizing or not self.rotation_angle) \
+                else self._rotated_pixmap(draw_w, draw_h)
+            if rotated is not None:
+                c = (self._max_square_side(draw_w, draw_h) - 1) // 2
+                p.drawPixmap(QPoint(r.center().x() - c, r.center().y() - c), rotated)
+            elif not pm.isNull():
                 base_w, base_h = self.base_w, self.base_h
                 scaling = (draw_w != base_w) or (draw_h != base_h)
                 _set_smooth(scaling)
-                p.save()
+                t = p.worldTransform()
                 cx, cy = r.center().x(), r.center().y()
                 p.translate(cx, cy)
                 if self.rotation_angle:
                     p.rotate(self.rotation_angle)
-                if scaling:
-                    p.scale(draw_w / max(1, base_w), draw_h / max(1, base_h))
-                p.drawPixmap(QRect(-base_w // 2, -base_h // 2, base_w, base_h), pm)
-                p.restore()
+                p.drawPixmap(QRect(-draw_w // 2, -draw_h // 2, draw_w, draw_h), pm)
+                p.setWorldTransform(t)
 
         # ===== 리사이즈 삼각 버튼: 검은 테두리, 흰색 채움 =====
         if (not self.locked) and self._resize_tri is not None and self._show_resize_handle:
@@ -568,6 +1110,7 @@ class StickerWindow(QWidget):
         self.rotating = True
         self.rotation_start_x = QCursor.pos().x()
         self.start_angle = self.rotation_angle
+        self.clearMask()  # 드래그 동안 마스크 해제, 종료 시 1회 재적용
         self.grabMouse(Qt.PointingHandCursor)
         self.setCursor(Qt.PointingHandCursor)
 
@@ -577,7 +1120,8 @@ class StickerWindow(QWidget):
             try: self.releaseMouse()
             except Exception: pass
             self.setCursor(Qt.ArrowCursor)
-            self.stateChanged.emit()
+            self._apply_rotated_rect_mask()
+            self.stateChanged.emit(self.sticker_id)
             self._update_overlay_visibility()
 
     # ======= 리사이즈 앵커/센터 =======
@@ -586,8 +1130,7 @@ class StickerWindow(QWidget):
         return self.mapToGlobal(local)
 
     def _center_from_anchor(self, anchor_global: QPoint, w: int, h: int) -> QPoint:
-        a = math.radians(self.rotation_angle or 0.0)
-        ca, sa = math.cos(a), math.sin(a)
+        ca, sa = self._trig()
         vx, vy = -w/2.0, -h/2.0
         rx = vx * ca - vy * sa
         ry = vx * sa + vy * ca
@@ -614,6 +1157,7 @@ class StickerWindow(QWidget):
                 self._resize_anchor_pt = self._image_top_left_global(cur_w, cur_h)
                 self._scale_ema = 1.0
                 self._last_applied_geom = self.geometry()
+                self.clearMask()
                 self.setCursor(Qt.SizeFDiagCursor)
             else:
                 self.dragging = True
@@ -630,24 +1174,48 @@ class StickerWindow(QWidget):
             self._update_overlay_visibility(e.pos())
             return
 
+        if self.rotating or self.resizing:
+            # 고주파 이벤트는 마지막 위치만 저장하고 타이머에서 한 번에 처리
+            self._pending_move_gpos = e.globalPosition().toPoint()
+            if not self._move_timer.isActive():
+                self._move_timer.start()
+            return
+
+        if self.dragging:
+            # 창 이동은 이벤트 루프 1회당 1번만
+            delta = e.globalPosition().toPoint() - self.drag_start
+            self._pending_pos = self.win_start + delta
+            if not self._move_scheduled:
+                self._move_scheduled = True
+                QTimer.singleShot(0, self._flush_move)
+            self._update_overlay_visibility(e.pos())
+            return
+
+        self.setCursor(Qt.SizeFDiagCursor if self._hit_test_resize(e.pos()) else Qt.ArrowCursor)
+        self._update_overlay_visibility(e.pos())
+
+    def _process_pending_move(self):
+        gpos = self._pending_move_gpos
+        if gpos is None or self.locked:
+            return
+        self._pending_move_gpos = None
+        pos = self.mapFromGlobal(gpos)
+
         if self.rotating:
-            gx = e.globalPosition().toPoint().x()
+            gx = gpos.x()
             dx = gx - self.rotation_start_x
             self.rotation_angle = self.start_angle + dx * self.rotate_scale
-            self.setUpdatesEnabled(False)
             self._place_overlay_controls()
-            self._apply_rotated_rect_mask_throttled()
-            self.setUpdatesEnabled(True)
             self.update()
-            self._update_overlay_visibility(e.pos())
+            self._update_overlay_visibility(pos)
             return
 
         if self.resizing:
             wc = self.rect().center()
-            vxw = e.pos().x() - wc.x()
-            vyw = e.pos().y() - wc.y()
-            a = -math.radians(self.rotation_angle or 0.0)
-            ca, sa = math.cos(a), math.sin(a)
+            vxw = pos.x() - wc.x()
+            vyw = pos.y() - wc.y()
+            ca, sa = self._trig()
+            sa = -sa
             vxi = vxw * ca - vyw * sa
             vyi = vxw * sa + vyw * ca
 
@@ -691,27 +1259,20 @@ class StickerWindow(QWidget):
                 abs(g.height() - required_side) >= 2
             )
             if need_apply:
-                self.setUpdatesEnabled(False)
                 self.setGeometry(new_x, new_y, required_side, required_side)
                 self._place_overlay_controls()
-                self._apply_rotated_rect_mask_throttled()
                 if self.movie and self.movie.isValid():
                     self.movie.setScaledSize(QSize(new_w, new_h))
-                self.setUpdatesEnabled(True)
                 self._last_applied_geom = QRect(new_x, new_y, required_side, required_side)
 
             self.update()
-            self._update_overlay_visibility(e.pos())
-            return
-
-        if self.dragging:
-            delta = e.globalPosition().toPoint() - self.drag_start
-            self.move(self.win_start + delta)
-            self._update_overlay_visibility(e.pos())
-            return
+            self._update_overlay_visibility(pos)
 
-        self.setCursor(Qt.SizeFDiagCursor if self._hit_test_resize(e.pos()) else Qt.ArrowCursor)
-        self._update_overlay_visibility(e.pos())
+    def _flush_move(self):
+        self._move_scheduled = False
+        pos, self._pending_pos = self._pending_pos, None
+        if pos is not None:
+            self.move(pos)
 
     def _finalize_pending_resize(self):
         if self._resizing_pending_size is None:
@@ -724,7 +1285,10 @@ class StickerWindow(QWidget):
         if self.movie and self.movie.isValid():
             self.movie.setScaledSize(QSize(self.base_w, self.base_h))
         else:
-            self.pm_base = load_pixmap_fixed(self.image_path, QSize(self.base_w, self.base_h), self.device_ratio)
+            target = QSize(self.base_w, self.base_h)
+            self.pm_base = load_pixmap_fixed(self.image_path, target, self.device_ratio)
+            # 다음 실행 복원 시 원본 디코드 대신 사용할 축소본
+            store_sidecar_async(self.image_path, target, self.device_ratio, self.pm_base)
         self._resizing_pending_size = None
 
         required_side = self._max_square_side(self.base_w, self.base_h)
@@ -732,11 +1296,9 @@ class StickerWindow(QWidget):
         new_x = int(round(new_center_global.x() - required_side/2))
         new_y = int(round(new_center_global.y() - required_side/2))
 
-        self.setUpdatesEnabled(False)
         self.setGeometry(new_x, new_y, required_side, required_side)
         self._place_overlay_controls()
         self._apply_rotated_rect_mask()
-        self.setUpdatesEnabled(True)
 
         self.update()
         self._update_overlay_visibility()
@@ -746,6 +1308,9 @@ class StickerWindow(QWidget):
         self._last_applied_geom = None
 
     def mouseReleaseEvent(self, e):
+        if self._move_timer.isActive():
+            self._move_timer.stop()
+            self._process_pending_move()  # 마지막 위치 정확히 반영
         if e.button() == Qt.LeftButton and self.rotating:
             self._finish_rotate()
             return
@@ -754,12 +1319,14 @@ class StickerWindow(QWidget):
             moved = self.dragging
             resized = self.resizing
             self.dragging = False
+            if moved:
+                self._flush_move()  # 저장 전에 최종 위치 반영
             if self.resizing:
                 self.resizing = False
                 self._finalize_pending_resize()
-                self.stateChanged.emit()
+                self.stateChanged.emit(self.sticker_id)
             if moved:
-                self.stateChanged.emit()
+                self.stateChanged.emit(self.sticker_id)
             if (moved or resized) and not self.locked:
                 self.unsetCursor()
         self._update_overlay_visibility(e.pos())
@@ -771,6 +1338,7 @@ class StickerWindow(QWidget):
     def leaveEvent(self, e):
         self.btn_close.setVisible(False)
         self.btn_rotate.setVisible(False)
+        self._last_hover_inside = None
         if self._show_resize_handle:
             self._show_resize_handle = False
             self.update()
@@ -819,54 +1387,48 @@ class StickerWindow(QWidget):
             if self.locked:
                 self.dragging = False; self.resizing = False; self.rotating = False
                 self.setCursor(Qt.ArrowCursor)
-            self.stateChanged.emit()
+                self._apply_rotated_rect_mask()
+            self.stateChanged.emit(self.sticker_id)
         elif act == self._act_top:
-            self._apply_topmost(True); self.stateChanged.emit()
+            self._apply_topmost(True); self.stateChanged.emit(self.sticker_id)
         elif act == self._act_bot:
-            self._apply_topmost(False); self.stateChanged.emit()
+            self._apply_topmost(False); self.stateChanged.emit(self.sticker_id)
         elif act == self._act_reset:
             self.rotation_angle = 0.0
-            self.setUpdatesEnabled(False)
             self._place_overlay_controls()
             self._apply_rotated_rect_mask()
-            self.setUpdatesEnabled(True)
             self.update()
-            self.stateChanged.emit()
+            self.stateChanged.emit(self.sticker_id)
             self._update_overlay_visibility()
         elif act == self._act_close:
             self.close()
 
     # 히트테스트
     @staticmethod
-    def _pt_in_triangle(p: QPoint, a: QPoint, b: QPoint, c: QPoint) -> bool:
-        x, y = p.x(), p.y()
-        x1, y1 = a.x(), a.y()
-        x2, y2 = b.x(), b.y()
-        x3, y3 = c.x(), c.y()
-        denom = ((y2 - y3)*(x1 - x3) + (x3 - x2)*(y1 - y3))
-        if denom == 0:
-            return False
-        u = ((y2 - y3)*(x - x3) + (x3 - x2)*(y - y3)) / denom
-        v = ((y3 - y1)*(x - x3) + (x1 - x3)*(y - y3)) / denom
-        w = 1 - u - v
-        return (u >= 0) and (v >= 0) and (w >= 0)
+    def _pt_in_triangle(p: QPoint, coefs) -> bool:
+        x3, y3, a1, b1, a2, b2 = coefs
+        dx = p.x() - x3
+        dy = p.y() - y3
+        u = a1 * dx + b1 * dy
+        v = a2 * dx + b2 * dy
+        return (u >= 0) and (v >= 0) and (u + v <= 1)
 
     def _hit_test_resize(self, pos: QPoint) -> bool:
-        if self.locked or self._resize_tri_pts is None or not self._show_resize_handle:
+        if self.locked or self._hit_coefs is None or not self._show_resize_handle:
             return False
-        a, b, c = self._resize_tri_pts
-        return self._pt_in_triangle(pos, a, b, c)
+        return self._pt_in_triangle(pos, self._hit_coefs)
 
     # 직렬화 (센터 저장)
     def is_topmost(self) -> bool:
         return bool(self.windowFlags() & WT("WindowStaysOnTopHint"))
 
     def to_state(self) -> Dict:
+        # frameGeometry 1회 조회로 x/y/center 모두 계산 (x()/y() 도 frame 기준)
         fg = self.frameGeometry()
         center = fg.center()
         return {
             "path": self.image_path,
-            "x": int(self.x()), "y": int(self.y()),         # 구버전 호환
+            "x": fg.x(), "y": fg.y(),                       # 구버전 호환
             "cx": int(center.x()), "cy": int(center.y()),   # 센터 저장
             "w": int(self.base_w), "h": int(self.base_h),
             "topmost": self.is_topmost(),
@@ -920,13 +1482,20 @@ class StickerWindow(QWidget):
 # ================== Toolbar ==================
 class StickerToolbar(QMainWindow):
     __slots__ = ("btn_add", "btn_quit", "_drag", "_drag_start", "_win_start",
-                 "tray", "stickers", "save_manager",
+                 "tray", "_tray_pm", "stickers", "save_manager", "_save_timer",
+                 "_sticker_states", "_dirty_ids", "_sticker_pool",
                  "_act_autorun", "_act_toolbar_show")
 
     def __init__(self, save_manager: SaveManager):
         super().__init__()
         self.save_manager = save_manager
         self.setWindowFlags(Qt.Tool | WT("FramelessWindowHint"))
+
+        # 저장 병합(스로틀): 첫 요청 후 250ms 에 1회 직렬화+기록, 그 사이 요청은 같은 flush 에 합쳐짐
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(250)
+        self._save_timer.timeout.connect(self._flush_save)
         self.setWindowTitle("Sticker Board")
         self.setMinimumSize(160, 56)
         self.setWindowOpacity(0.96)
@@ -947,10 +1516,18 @@ class StickerToolbar(QMainWindow):
 
         self._drag = False
         self.stickers: List[StickerWindow] = []
+        # 부분 직렬화: sticker_id -> 마지막 to_state(), 변경된 id만 다시 계산
+        self._sticker_states: Dict[str, Dict] = {}
+        self._dirty_ids: Set[str] = set()
+        # 닫힌 스티커 재사용 (위젯 생성/파괴 churn 감소)
+        self._sticker_pool: List[StickerWindow] = []
         self.resize(200, 60); self.move(80, 80)
 
         self.tray = QSystemTrayIcon(self)
-        self.tray.setIcon(self.style().standardIcon(QStyle.SP_ComputerIcon))
+        # 트레이 아이콘: 목표 크기 pixmap 1회 렌더 후 재사용 (QIconEngine 재스케일 방지)
+        self._tray_pm = _std_icon(QStyle.SP_ComputerIcon).pixmap(
+            QSize(16, 16), max(1.0, self.devicePixelRatioF()))
+        self.tray.setIcon(QIcon(self._tray_pm))
         menu = QMenu()
 
         self._act_toolbar_show = menu.addAction("메뉴바 표시")
@@ -988,7 +1565,16 @@ class StickerToolbar(QMainWindow):
 
     def _on_about_to_quit(self):
         global IS_EXITING
+        if IS_EXITING:
+            return
+        self._save_timer.stop()
         IS_EXITING = True
+        self.save_manager.close_async()
+        QThreadPool.globalInstance().waitForDone(2000)
+        # 종료 시 최종본은 JSON 으로 (state.bin 보다 새로워져 다음 실행에서 우선)
+        # 해시 게이트 생략: 로드 시점과 같은 상태여도 mtime 이 state.bin 보다 앞서야 함
+        self.save_manager.save(self.build_state(), force=True)
+        self.save_manager.flush(fsync=True)
 
     def _quit_app(self):
         self._on_about_to_quit()
@@ -1023,54 +1609,120 @@ class StickerToolbar(QMainWindow):
 
     # ----- 스티커 관리 / 저장 트리거 -----
     def _apply_cache_budget(self):
-        n = max(1, len(self.stickers))
-        mb = min(64, max(16, n * 3))
+        # 실제 pixmap 크기 합산: 기본 pixmap + 회전된 스티커의 정사각 캐시 pixmap
+        px = 0
+        for s in self.stickers:
+            if s.movie is not None:
+                continue
+            px += s.base_w * s.base_h
+            if s.rotation_angle:
+                side = s._max_square_side(s.base_w, s.base_h)
+                px += side * side
+        # HiDPI: pixmap 메모리는 dpr^2 배, 선적재/트레이 등 여유 25%
+        dpr = max(1.0, self.devicePixelRatioF())
+        mb = int(min(256, max(32, px * 4 * dpr * dpr * 1.25 / (1024 * 1024))))
         try:
             QPixmapCache.setCacheLimit(mb * 1024)  # KB
         except Exception:
             pass
 
     def pick_images(self):
-        files, _ = QFileDialog.getOpenFileNames(self, "이미지 선택", "", "Images (*.png *.jpg *.jpeg *.bmp *.webp *.gif)")
+        # 네트워크 드라이브에서 항목별 stat/아이콘 조회 방지
+        opts = (QFileDialog.DontUseCustomDirectoryIcons
+                | QFileDialog.DontResolveSymlinks
+                | QFileDialog.ReadOnly)
+        files, _ = QFileDialog.getOpenFileNames(self, "이미지 선택", "", "Images (*.png *.jpg *.jpeg *.bmp *.webp *.gif)",
+                                                "", opts)
         if not files:
             return
         x, y = self.x(), self.y() + self.height() + 10
         for i, f in enumerate(files):
-            self.create_sticker(f, QPoint(x + i * 28, y + i * 28))
+            # 파일 대화상자가 방금 돌려준 경로 → 재확인 생략
+            self.create_sticker(f, QPoint(x + i * 28, y + i * 28), exists_checked=True)
         self.save_all()
 
-    def create_sticker(self, path: str, pos: Optional[QPoint] = None, *, show_now: bool = True, initial_topmost: bool = True) -> Optional[StickerWindow]:
-        if not path or not os.path.exists(path):
+    def create_sticker(self, path: str, pos: Optional[QPoint] = None, *, show_now: bool = True, initial_topmost: bool = True,
+                       exists_checked: bool = False, sticker_id: Optional[str] = None,
+                       base_size: Optional[QSize] = None, apply_budget: bool = True) -> Optional[StickerWindow]:
+        if not path or not (exists_checked or os.path.exists(path)):
             return None
-        s = StickerWindow(path, start_pos=pos, initial_topmost=initial_topmost)  # 기본 True
-        s.stateChanged.connect(self.save_all)
-        s.destroyed.connect(lambda *_: self._cleanup_and_save(s))
+        if self._sticker_pool:
+            s = self._sticker_pool.pop()
+            s.setAttribute(Qt.WA_DeleteOnClose, True)
+            s.rebind(path, pos, initial_topmost=initial_topmost, sticker_id=sticker_id, base_size=base_size)
+        else:
+            s = StickerWindow(path, start_pos=pos, initial_topmost=initial_topmost, sticker_id=sticker_id,
+                              base_size=base_size)  # 기본 True
+            # Queued: 같은 이벤트 루프 회차의 연속 emit 은 한 번에 처리됨
+            s.stateChanged.connect(self._on_sticker_changed, Qt.QueuedConnection)
+            s.closed.connect(self._on_sticker_closed)
+            s.destroyed.connect(lambda *_: self._cleanup_and_save(s))
         if show_now:
             s.show()
         self.stickers.append(s)
-        self._apply_cache_budget()
+        self._dirty_ids.add(s.sticker_id)
+        if apply_budget:
+            self._apply_cache_budget()
         return s
 
-    def _cleanup_and_save(self, s: StickerWindow):
+    def _on_sticker_changed(self, sticker_id: str):
+        self._dirty_ids.add(sticker_id)
+        self._apply_cache_budget()  # 회전/크기 변경 시 캐시 필요량도 변함
+        self.save_all()
+
+    def _on_sticker_closed(self, s: StickerWindow):
         try: self.stickers.remove(s)
+        except ValueError: return
+        self._dirty_ids.add(s.sticker_id)
+        if len(self._sticker_pool) < STICKER_POOL_MAX:
+            # closeEvent 직후 WA_DeleteOnClose 를 확인하므로 여기서 끄면 파괴되지 않음
+            s.setAttribute(Qt.WA_DeleteOnClose, False)
+            s.reset()
+            self._sticker_pool.append(s)
+        self._apply_cache_budget()
+        self.save_all()
+
+    def _cleanup_and_save(self, s: StickerWindow):
+        try: self._sticker_pool.remove(s)
         except ValueError: pass
+        try: self.stickers.remove(s)
+        except ValueError: return
+        # close 를 거치지 않은 파괴: 남은 스티커 기준으로 id 정리
+        alive = {st.sticker_id for st in self.stickers}
+        self._dirty_ids.update(sid for sid in self._sticker_states if sid not in alive)
         self._apply_cache_budget()
         self.save_all()
 
     def build_state(self) -> Dict:
+        if self._dirty_ids:
+            by_id = {st.sticker_id: st for st in self.stickers}
+            for sid in self._dirty_ids:
+                st = by_id.get(sid)
+                if st is None:
+                    self._sticker_states.pop(sid, None)
+                else:
+                    self._sticker_states[sid] = st.to_state()
+            self._dirty_ids.clear()
+        fg = self.frameGeometry()
         return {
-            "version": 23,  # TopMost SetWindowPos 보강
+            "version": 24,  # 스티커별 id 맵 (부분 직렬화)
             "toolbar": {
-                "x": int(self.x()), "y": int(self.y()),
+                "x": fg.x(), "y": fg.y(),
                 "visible": not self.isHidden(),
             },
-            "stickers": [st.to_state() for st in self.stickers if isinstance(st, StickerWindow)],
+            # 얕은 복사: 워커 스레드 직렬화 중에도 캐시 갱신 가능
+            "stickers": dict(self._sticker_states),
         }
 
     def save_all(self):
-        if IS_EXITING:
-            return
-        self.save_manager.save(self.build_state())
+        if IS_EXITING or self._save_timer.isActive():
+            return  # 이미 예약됨: 상태는 flush 시점에 만들어지므로 변경분 누락 없음
+        self._save_timer.start()
+
+    def _flush_save(self):
+        self._save_timer.stop()
+        # 상태 스냅샷만 GUI 스레드에서, 직렬화+기록은 워커에서
+        self.save_manager.save_async(self.build_state())
 
     def restore_from_save(self):
         data = self.save_manager.load()
@@ -1085,22 +1737,57 @@ class StickerToolbar(QMainWindow):
             try: self._act_toolbar_show.setChecked(vis)
             except Exception: pass
 
-            stickers = data.get("stickers", [])
-            cleaned_stickers = []
-            for st in stickers:
-                path = st.get("path", "")
-                if not path or not os.path.exists(path):
-                    continue
-                s = self.create_sticker(path, None, show_now=False, initial_topmost=False)
-                if s is None:
-                    continue
-                s.apply_state(st)
-                s.show()
-                cleaned_stickers.append(st)
-
-            if len(cleaned_stickers) != len(stickers):
-                data["stickers"] = cleaned_stickers
-                self.save_manager.save(data)
+            raw = data.get("stickers", [])
+            # v24+: {id: state}, 이전 버전: [state, ...]
+            legacy = not isinstance(raw, dict)
+            entries = [(uuid.uuid4().hex, st) for st in raw] if legacy else list(raw.items())
+            # 느린 파일시스템(네트워크/클라우드) stat 을 병렬로 미리 확인
+            paths = list({st.get("path", "") for _, st in entries} - {""})
+            screen = QGuiApplication.primaryScreen()
+            dpr = (screen.devicePixelRatio() if screen else 1.0) or 1.0
+            cleaned: Dict[str, Dict] = {}
+            with ThreadPoolExecutor(max_workers=8) as ex:
+                exists = existing_paths(paths, ex)
+                live = [(sid, st) for sid, st in entries if st.get("path", "") in exists]
+
+                # 저장된 크기로 워커에서 QImage 디코드 → GUI 스레드에서 QPixmap 변환 후 캐시 선적재
+                decodes = []
+                for _, st in live:
+                    path = st["path"]
+                    if "w" in st and "h" in st and not path.lower().endswith(".gif"):
+                        target = QSize(max(32, int(st["w"])), max(32, int(st["h"])))
+                        decodes.append((target, ex.submit(_read_scaled_image_cached, path, target, dpr)))
+                    else:
+                        decodes.append(None)
+
+                for i, (sid, st) in enumerate(live):
+                    path = st["path"]
+                    target = None
+                    job = decodes[i]
+                    if job is not None:
+                        target, fut = job
+                        # 변환 후 future 참조 해제 → QImage 가 QPixmap 과 함께 끝까지 남지 않음
+                        decodes[i] = job = None
+                        key = _pixmap_key(path, target, dpr)
+                        if _cache_find(key) is None:
+                            _cache_insert(key, _pixmap_from_image(fut.result(), target, dpr))
+                        del fut
+                    s = self.create_sticker(path, None, show_now=False, initial_topmost=False, exists_checked=True,
+                                            sticker_id=sid, base_size=target, apply_budget=False)
+                    if s is None:
+                        continue
+                    s.apply_state(st)
+                    s.show()
+                    cleaned[sid] = st
+
+            # 예산은 apply_state()로 회전각이 반영된 뒤 1회 계산
+            self._apply_cache_budget()
+
+            # 복원 직후에는 저장된 상태가 곧 최신 상태
+            self._sticker_states = cleaned
+            self._dirty_ids.clear()
+            if legacy or len(cleaned) != len(entries):
+                self.save_manager.save(self.build_state())
 
         except Exception:
             pass
@@ -1108,27 +1795,35 @@ class StickerToolbar(QMainWindow):
 
 # ================== Main ==================
 def main():
-    try:
-        QPixmapCache.setCacheLimit(16 * 1024)  # 16MB (KB)
-    except Exception:
-        pass
-
     QApplication.setAttribute(Qt.AA_CompressHighFrequencyEvents, True)
 
     app = QApplication(sys.argv)
     app.setQuitOnLastWindowClosed(False)
 
+    try:
+        screen = QGuiApplication.primaryScreen()
+        dpr = max(1.0, screen.devicePixelRatio() if screen else 1.0)
+        QPixmapCache.setCacheLimit(int(32 * 1024 * dpr * dpr))  # 32MB × dpr^2 (KB)
+    except Exception:
+        pass
+
     sm = SaveManager()
 
     # Robust Singleton
     lock_path = os.path.join(sm.base, "StickerBoard.lock")
     lock = QLockFile(lock_path)
     lock.setStaleLockTime(30000)
-    if not lock.tryLock(1):
+    if not lock.tryLock(0):
+        # 다른 프로세스가 잡고 있는 경우에만 stale 제거 후 1회 재시도
+        if lock.error() != QLockFile.LockFailedError:
+            sys.exit(0)
         lock.removeStaleLockFile()
-        if not lock.tryLock(1):
+        if not lock.tryLock(0):
             sys.exit(0)
 
+    # 캐시 정리는 락 획득 후에만 (실행 중인 인스턴스의 사이드카 보호)
+    configure_sidecar_cache(sm.cache_dir)
+
     try:
         QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
             QGuiApplication.HighDpiScaleFactorRoundingPolicy.PassThrough